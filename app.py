@@ -129,7 +129,7 @@ if selected == sidebar_items[0]:
     @st.cache_resource(show_spinner=False)
     def load_rag_system():
         """Load RAG system (cached to avoid reloading)."""
-        rag = RAGSystem()
+        rag = RAGSystem(embedding_backend=os.getenv("EMBEDDING_BACKEND", "huggingface"))
         rag.setup(force_rebuild=False)
         return rag
 
@@ -260,6 +260,38 @@ if selected == sidebar_items[1]:
     st.header("📚 Publications")
     st.write("Explore my peer-reviewed research on phytoplankton size structure and community dynamics in lake ecosystems.")
 
+    # Full-text search over the PDFs (precomputed index, no embedding or LLM call per query)
+    from config.text_index import TextIndex, highlight_markdown, source_signature
+
+    @st.cache_resource(show_spinner=False)
+    def load_text_index(signature, index_path="text_index.json", index_folder="MS"):
+        """Load the full-text index (cached per PDF signature), rebuilding it if missing or stale."""
+        if os.path.exists(index_path):
+            index = TextIndex.load(index_path)
+            if index.is_current(index_folder):
+                return index
+        index = TextIndex.from_pdfs(index_folder)
+        index.save(index_path)
+        return index
+
+    search_query = st.text_input(
+        "🔍 Search the manuscripts and supplements",
+        placeholder="e.g., grazing specialist, size classes, Greifensee"
+    )
+
+    if search_query:
+        with st.spinner("Loading search index..."):
+            # Changed PDFs change the cache key, so a stale index is never served
+            text_index = load_text_index(json.dumps(source_signature("MS")))
+        results = text_index.search(search_query, limit=10)
+
+        if not results:
+            st.info("No matching pages found.")
+        for result in results:
+            st.markdown(f"**{result['source'].removesuffix('.pdf')}**, Page {result['page']}")
+            st.markdown(highlight_markdown(result))
+            st.markdown("---")
+
     tab_names_ms = ["Manuscript 1 (2024)", "Manuscript 2 (2025)", "Manuscript 3 (Under Review)"]
     tab1, tab2, tab3 = st.tabs(tab_names_ms)
 
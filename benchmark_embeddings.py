@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Embedding backend benchmark
+Checks that the ONNX encoder matches sentence-transformers within tolerance and
+compares model load time, per-query latency and resident memory (RSS)
+"""
+
+import argparse
+import multiprocessing as mp
+import queue as queue_module
+import resource
+import sys
+import time
+import numpy as np
+from config.onnx_embeddings import DEFAULT_MODEL_DIR, DEFAULT_MODEL_NAME
+
+SAMPLE_QUERIES = [
+    "What is the main focus of your PhD research?",
+    "How does grazing strategy affect phytoplankton size structure?",
+    "Why do large phytoplankton dominate in nutrient-rich lakes?",
+    "What happens to algae under lake ice in winter?",
+    "How does vertical mixing influence nutrient availability?",
+    "Which environmental factors drive competitive exclusion?",
+    "What is the trade-off between cell size and growth rate?",
+    "How were the models validated against Greifensee data?",
+]
+
+
+def peak_rss_mb():
+    """Peak resident memory of the current process in MB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def load_backend(backend, model_name, model_dir):
+    """Create the embedding model for a backend without the Streamlit cache."""
+    if backend == "onnx":
+        from config.onnx_embeddings import ONNXEmbeddings
+        return ONNXEmbeddings(model_dir=model_dir)
+
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={'device': 'cpu'},
+        encode_kwargs={'normalize_embeddings': True}
+    )
+
+
+def run_backend(backend, model_name, model_dir, repeats, queue):
+    """Measure one backend (run in a fresh process so RSS is not shared)."""
+    try:
+        queue.put(measure_backend(backend, model_name, model_dir, repeats))
+    except Exception as e:
+        queue.put({"backend": backend, "error": f"{type(e).__name__}: {e}"})
+
+
+def measure_backend(backend, model_name, model_dir, repeats):
+    """Time model loading and queries, and collect embeddings for the parity check."""
+    start = time.perf_counter()
+    model = load_backend(backend, model_name, model_dir)
+    load_time = time.perf_counter() - start
+
+    model.embed_query(SAMPLE_QUERIES[0])  # warm-up
+
+    latencies = []
+    for _ in range(repeats):
+        for query in SAMPLE_QUERIES:
+            start = time.perf_counter()
+            model.embed_query(query)
+            latencies.append(time.perf_counter() - start)
+
+    return {
+        "backend": backend,
+        "load_s": load_time,
+        "median_ms": float(np.median(latencies)) * 1000,
+        "p95_ms": float(np.percentile(latencies, 95)) * 1000,
+        "rss_mb": peak_rss_mb(),
+        "embeddings": np.array([model.embed_query(q) for q in SAMPLE_QUERIES]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model-name", default=DEFAULT_MODEL_NAME,
+                        help="Model (or local path) for the sentence-transformers backend")
+    parser.add_argument("--model-dir", default=DEFAULT_MODEL_DIR, help="Folder of the ONNX export")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds allowed per backend")
+    parser.add_argument("--repeats", type=int, default=20, help="Passes over the sample queries")
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="Maximum allowed 1 - cosine similarity between backends")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Embedding Backend Benchmark")
+    print("=" * 60)
+    print()
+
+    ctx = mp.get_context("spawn")
+    results = {}
+    for backend in ["huggingface", "onnx"]:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_backend,
+                           args=(backend, args.model_name, args.model_dir, args.repeats, queue))
+        proc.start()
+        try:
+            r = queue.get(timeout=args.timeout)
+        except queue_module.Empty:
+            r = {"error": f"no result after {args.timeout:.0f} s (exit code {proc.exitcode})"}
+            proc.terminate()
+        proc.join()
+
+        if "error" in r:
+            print(f"❌ {backend} failed: {r['error']}")
+            if backend == "onnx" and "config.onnx_embeddings" not in r["error"]:
+                print("Export the ONNX encoder first with: python -m config.onnx_embeddings")
+            sys.exit(1)
+        results[backend] = r
+
+        print(f"✓ {backend}")
+        print(f"  Load time:      {r['load_s']:.2f} s")
+        print(f"  Query latency:  {r['median_ms']:.2f} ms (median), {r['p95_ms']:.2f} ms (p95)")
+        print(f"  Peak RSS:       {r['rss_mb']:.0f} MB\n")
+
+    # Parity: both backends return normalized vectors, so the dot product is the cosine
+    reference = results["huggingface"]["embeddings"]
+    candidate = results["onnx"]["embeddings"]
+    cosine = (reference * candidate).sum(axis=1)
+    max_abs = np.abs(reference - candidate).max()
+
+    print("=" * 60)
+    print("PARITY")
+    print("=" * 60)
+    print(f"Min cosine similarity: {cosine.min():.4f}")
+    print(f"Max abs difference:    {max_abs:.4f}")
+
+    if 1 - cosine.min() > args.tolerance:
+        print(f"❌ ONNX embeddings differ by more than {args.tolerance}")
+        sys.exit(1)
+    print("✅ ONNX embeddings match within tolerance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Full-text search benchmark
+Measures index build time, index size, load time and query latency
+for the Manuscripts tab search (offline, no embedding or LLM calls)
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from config.text_index import TextIndex
+
+SAMPLE_QUERIES = [
+    "grazing",
+    "specialist generalist",
+    "size classes",
+    "nutrient-rich conditions",
+    "Greifensee",
+    "competitive exclusion",
+    "allometric trade-off growth",
+    "mixing temperature light",
+    "phosphorus nitrogen",
+    "sensitivity analysis parameters",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--folder", default="MS", help="Folder with the PDFs to index")
+    parser.add_argument("--repeats", type=int, default=100, help="Passes over the sample queries")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Full-Text Search Benchmark")
+    print("=" * 60)
+    print()
+
+    start = time.perf_counter()
+    index = TextIndex.from_pdfs(args.folder)
+    build_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "text_index.json")
+        index.save(index_path)
+        index_size = os.path.getsize(index_path)
+
+        start = time.perf_counter()
+        index = TextIndex.load(index_path)
+        load_time = time.perf_counter() - start
+
+    latencies = []
+    for _ in range(args.repeats):
+        for query in SAMPLE_QUERIES:
+            start = time.perf_counter()
+            index.search(query)
+            latencies.append(time.perf_counter() - start)
+
+    print()
+    print(f"Build time:     {build_time:.2f} s ({len(index.pages)} pages)")
+    print(f"Index size:     {index_size / 1024 / 1024:.2f} MB ({len(index.postings)} terms)")
+    print(f"Load time:      {load_time * 1000:.1f} ms")
+    print(f"Query latency:  {np.median(latencies) * 1000:.3f} ms (median), "
+          f"{np.percentile(latencies, 95) * 1000:.3f} ms (p95)")
+    print()
+
+    for query in SAMPLE_QUERIES[:3]:
+        results = index.search(query, limit=3)
+        hits = ", ".join(f"{r['source']} p.{r['page']}" for r in results) or "no matches"
+        print(f"'{query}': {hits}")
+
+
+if __name__ == "__main__":
+    main()
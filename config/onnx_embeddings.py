@@ -0,0 +1,153 @@
+"""
+ONNX Query Encoder
+Runs an exported, int8-quantized ONNX version of all-MiniLM-L6-v2 from local files.
+No PyTorch and no network access are needed at runtime.
+"""
+
+import os
+from pathlib import Path
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_MODEL_DIR = "models/all-MiniLM-L6-v2-onnx"
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+
+
+class ONNXEmbeddings(Embeddings):
+    """Sentence embeddings from a local ONNX export of a sentence-transformers model."""
+
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR, model_file=QUANTIZED_MODEL_FILE,
+                 max_length=256, batch_size=32, normalize_embeddings=True, num_threads=None):
+        # Lazy import so the PyTorch backend does not need onnxruntime installed
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_path = Path(model_dir) / model_file
+        tokenizer_path = Path(model_dir) / "tokenizer.json"
+        if not model_path.exists() or not tokenizer_path.exists():
+            raise FileNotFoundError(
+                f"ONNX encoder not found in {model_dir}. "
+                "Export it first with: python -m config.onnx_embeddings"
+            )
+
+        self.batch_size = batch_size
+        self.normalize_embeddings = normalize_embeddings
+
+        # Same truncation as sentence-transformers (max_seq_length=256 for MiniLM-L6-v2)
+        self.tokenizer = Tokenizer.from_file(str(tokenizer_path))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {inp.name for inp in self.session.get_inputs()}
+
+    def _encode(self, texts):
+        """Tokenize, run the model and mean-pool token embeddings."""
+        outputs = []
+        for start in range(0, len(texts), self.batch_size):
+            encodings = self.tokenizer.encode_batch(texts[start:start + self.batch_size])
+            input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            # Mean pooling over non-padding tokens (matches sentence-transformers)
+            mask = attention_mask[..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+            if self.normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            outputs.append(pooled)
+
+        if not outputs:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(outputs)
+
+    def embed_documents(self, texts):
+        """Embed a list of document chunks."""
+        return self._encode(list(texts)).tolist()
+
+    def embed_query(self, text):
+        """Embed a single query."""
+        return self._encode([text])[0].tolist()
+
+
+def export_model(model_name=DEFAULT_MODEL_NAME, output_dir=DEFAULT_MODEL_DIR):
+    """
+    Export a sentence-transformers model to ONNX and quantize it to int8.
+
+    Needs torch and transformers (already installed with sentence-transformers)
+    plus onnxruntime and onnx. Only run once; the app then loads the files offline.
+
+    Args:
+        model_name: Hugging Face model to export
+        output_dir: Folder for model.onnx, model_quantized.onnx and tokenizer.json
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    os.makedirs(output_dir, exist_ok=True)
+    fp32_path = os.path.join(output_dir, "model.onnx")
+    int8_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+
+    print(f"Exporting {model_name} to ONNX...")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+
+    class Encoder(torch.nn.Module):
+        """Fix the graph inputs by name so they cannot be bound to the wrong forward argument."""
+
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.model(
+                input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids
+            ).last_hidden_state
+
+    dummy = tokenizer(["a sample query"], return_tensors="pt")
+    input_names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            Encoder(model),
+            tuple(dummy[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+            dynamo=False,
+        )
+
+    print("Quantizing weights to int8...")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+
+    # Writes tokenizer.json, which the runtime loads with the `tokenizers` package
+    tokenizer.save_pretrained(output_dir)
+
+    fp32_size = os.path.getsize(fp32_path) / 1024 / 1024
+    int8_size = os.path.getsize(int8_path) / 1024 / 1024
+    print(f"✓ {fp32_size:.1f} MB → {int8_size:.1f} MB ({int8_path})")
+    return int8_path
+
+
+if __name__ == "__main__":
+    export_model()
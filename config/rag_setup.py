@@ -10,20 +10,38 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
 import streamlit as st
+from config.text_index import TextIndex
 
 
 class RAGSystem:
     """RAG system for querying PhD research documents."""
 
-    def __init__(self, data_folder="data", persist_directory="chroma_db"):
+    def __init__(self, data_folder="data", persist_directory="chroma_db", embedding_backend="huggingface",
+                 index_folder="MS", index_path="text_index.json"):
         self.data_folder = data_folder
         self.persist_directory = persist_directory
+        self.index_folder = index_folder  # Manuscripts and supplements for full-text search
+        self.index_path = index_path
+        self.embedding_backend = embedding_backend  # "huggingface" or "onnx"
         self.embeddings = None
         self.vectorstore = None
+        self.text_index = None
 
     @st.cache_resource
-    def initialize_embeddings(_self):
-        """Initialize embedding model (cached to avoid reloading)."""
+    def initialize_embeddings(_self, backend="huggingface"):
+        """
+        Initialize embedding model (cached to avoid reloading).
+
+        Args:
+            backend: "huggingface" for PyTorch sentence-transformers, or "onnx" for the
+                     local int8-quantized export (see config/onnx_embeddings.py)
+        """
+        if backend == "onnx":
+            from config.onnx_embeddings import ONNXEmbeddings
+            return ONNXEmbeddings()
+        if backend != "huggingface":
+            raise ValueError(f"Unknown embedding backend: {backend}")
+
         return HuggingFaceEmbeddings(
             model_name="sentence-transformers/all-MiniLM-L6-v2",
             model_kwargs={'device': 'cpu'},
@@ -61,7 +79,7 @@ class RAGSystem:
 
     def create_vectorstore(self, chunks):
         """Create and persist vector database from document chunks."""
-        self.embeddings = self.initialize_embeddings()
+        self.embeddings = self.initialize_embeddings(self.embedding_backend)
 
         print("Creating vector database...")
         self.vectorstore = Chroma.from_documents(
@@ -75,7 +93,7 @@ class RAGSystem:
 
     def load_vectorstore(self):
         """Load existing vector database."""
-        self.embeddings = self.initialize_embeddings()
+        self.embeddings = self.initialize_embeddings(self.embedding_backend)
 
         self.vectorstore = Chroma(
             persist_directory=self.persist_directory,
@@ -84,9 +102,16 @@ class RAGSystem:
 
         return self.vectorstore
 
+    def build_text_index(self):
+        """Build and persist the page-level full-text index of the manuscripts."""
+        self.text_index = TextIndex.from_pdfs(self.index_folder)
+        self.text_index.save(self.index_path)
+        print(f"Full-text index saved to {self.index_path}")
+        return self.text_index
+
     def setup(self, force_rebuild=False):
         """
-        Setup RAG system - create or load vector database.
+        Setup RAG system - create or load vector database and full-text index.
 
         Args:
             force_rebuild: If True, rebuild database even if it exists
@@ -99,6 +124,14 @@ class RAGSystem:
             print("Loading existing vector database...")
             self.load_vectorstore()
 
+        if force_rebuild or not os.path.exists(self.index_path):
+            self.build_text_index()
+        else:
+            self.text_index = TextIndex.load(self.index_path)
+            if not self.text_index.is_current(self.index_folder):
+                print(f"PDFs in {self.index_folder} changed, rebuilding full-text index...")
+                self.build_text_index()
+
         return self.vectorstore
 
 
@@ -113,6 +146,7 @@ def main():
     rag.setup(force_rebuild=rebuild)
     print("\n✓ RAG system ready!")
     print(f"✓ Vector database stored in: {rag.persist_directory}")
+    print(f"✓ Full-text index stored in: {rag.index_path}")
 
 
 if __name__ == "__main__":
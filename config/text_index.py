@@ -0,0 +1,199 @@
+"""
+Full-Text Search Index
+Page-level inverted index over the manuscript PDFs, persisted as JSON.
+Queries are answered from the index alone (no embedding or LLM call).
+"""
+
+import json
+import math
+import re
+import unicodedata
+from pathlib import Path
+
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")  # Unicode letters and digits
+MIN_TOKEN_LENGTH = 2
+MARKDOWN_SPECIALS = re.compile(r"([\\`*_{}\[\]<>()#+\-.!|$~])")
+
+
+def normalize(text):
+    """NFKC-normalize text, e.g. expanding the "ﬁ"/"ﬂ" ligatures pypdf extracts."""
+    return unicodedata.normalize("NFKC", text)
+
+
+def fold(token):
+    """Case-fold a token and drop accents, so "Zürich" and "Zurich" share a term."""
+    decomposed = unicodedata.normalize("NFKD", token.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    """
+    Yield (term, start, end) for every alphanumeric token of at least two characters.
+
+    Terms are folded, but start/end index the text as given, so they stay valid
+    for slicing snippets even where folding changes the length.
+    """
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.end() - match.start() >= MIN_TOKEN_LENGTH:
+            yield fold(match.group()), match.start(), match.end()
+
+
+def source_signature(folder):
+    """File name -> [size, mtime] of every PDF in a folder, to detect a stale index."""
+    return {
+        pdf_path.name: [pdf_path.stat().st_size, pdf_path.stat().st_mtime]
+        for pdf_path in sorted(Path(folder).glob("*.pdf"))
+    }
+
+
+class TextIndex:
+    """Inverted index mapping each term to the pages and character offsets it occurs at."""
+
+    def __init__(self):
+        self.pages = []     # [{"source": ..., "page": ..., "text": ...}]
+        self.postings = {}  # term -> {page_id: [offset, ...]}
+        self.sources = {}   # file name -> [size, mtime] when indexed
+
+    def add_page(self, source, page, text):
+        """
+        Index one page of text.
+
+        Args:
+            source: File name of the PDF
+            page: Page number (1-based, as printed to users)
+            text: Extracted page text
+        """
+        # Store the normalized text so that offsets and snippets refer to the same string
+        text = normalize(text)
+        page_id = len(self.pages)
+        self.pages.append({"source": source, "page": page, "text": text})
+        for term, start, _ in tokenize(text):
+            self.postings.setdefault(term, {}).setdefault(page_id, []).append(start)
+
+    @classmethod
+    def from_pdfs(cls, folder):
+        """Build an index from every PDF in a folder."""
+        from pypdf import PdfReader
+
+        index = cls()
+        index.sources = source_signature(folder)
+        pdf_files = sorted(Path(folder).glob("*.pdf"))
+        print(f"Indexing {len(pdf_files)} PDF files for full-text search...")
+
+        for pdf_path in pdf_files:
+            reader = PdfReader(str(pdf_path))
+            for page_number, page in enumerate(reader.pages, 1):
+                index.add_page(pdf_path.name, page_number, page.extract_text() or "")
+
+        print(f"Indexed {len(index.pages)} pages, {len(index.postings)} unique terms")
+        return index
+
+    def save(self, path):
+        """Persist the index as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"sources": self.sources, "pages": self.pages, "postings": self.postings}, f)
+
+    @classmethod
+    def load(cls, path):
+        """Load a persisted index."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        index = cls()
+        index.sources = data.get("sources", {})
+        index.pages = data["pages"]
+        # JSON object keys are strings; restore integer page ids
+        index.postings = {
+            term: {int(page_id): offsets for page_id, offsets in pages.items()}
+            for term, pages in data["postings"].items()
+        }
+        return index
+
+    def is_current(self, folder):
+        """True if the PDFs in the folder are the ones this index was built from."""
+        return self.sources == source_signature(folder)
+
+    def search(self, query, limit=10, snippet_chars=120):
+        """
+        Find pages matching the query, ranked by tf-idf.
+
+        Pages containing every query term are returned; if there are none, pages
+        containing any of them are ranked instead.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            snippet_chars: Characters of context on each side of the best match
+
+        Returns:
+            List of dicts with source, page, score, snippet and highlights
+            (list of (start, end) spans within the snippet)
+        """
+        query_terms = dict.fromkeys(term for term, _, _ in tokenize(normalize(query)))
+        terms = [term for term in query_terms if term in self.postings]
+        if not terms:
+            return []
+
+        page_sets = [set(self.postings[term]) for term in terms]
+        candidates = set.intersection(*page_sets) or set.union(*page_sets)
+
+        n_pages = len(self.pages)
+        idf = {term: math.log(1 + n_pages / len(self.postings[term])) for term in terms}
+        scores = {
+            page_id: sum(len(self.postings[term].get(page_id, ())) * idf[term] for term in terms)
+            for page_id in candidates
+        }
+        ranked = sorted(scores, key=scores.get, reverse=True)[:limit]
+
+        return [self._result(page_id, terms, idf, scores[page_id], snippet_chars) for page_id in ranked]
+
+    def _result(self, page_id, terms, idf, score, snippet_chars):
+        """Cut a snippet around the rarest matching term and locate every hit inside it."""
+        page = self.pages[page_id]
+        text = page["text"]
+        matched = [term for term in terms if page_id in self.postings[term]]
+
+        anchor = self.postings[max(matched, key=idf.get)][page_id][0]
+        start = max(0, anchor - snippet_chars)
+        end = min(len(text), anchor + snippet_chars)
+
+        highlights = []
+        for term in matched:
+            for offset in self.postings[term][page_id]:
+                # Re-match the token: its length in the text can differ from the folded term
+                token_end = TOKEN_PATTERN.match(text, offset).end()
+                if start <= offset and token_end <= end:
+                    highlights.append((offset - start, token_end - start))
+        highlights.sort()
+
+        return {
+            "source": page["source"],
+            "page": page["page"],
+            "score": score,
+            "snippet": text[start:end],
+            "highlights": highlights,
+            "truncated_start": start > 0,
+            "truncated_end": end < len(text),
+        }
+
+
+def highlight_markdown(result):
+    """Render a search result snippet as Markdown with matched terms in bold."""
+    snippet = result["snippet"]
+    parts = []
+    position = 0
+    for start, end in result["highlights"]:
+        if start < position:
+            continue  # overlapping hit
+        parts.append(MARKDOWN_SPECIALS.sub(r"\\\1", snippet[position:start]))
+        parts.append("**" + MARKDOWN_SPECIALS.sub(r"\\\1", snippet[start:end]) + "**")
+        position = end
+    parts.append(MARKDOWN_SPECIALS.sub(r"\\\1", snippet[position:]))
+
+    text = " ".join("".join(parts).split())
+    if result["truncated_start"]:
+        text = "…" + text
+    if result["truncated_end"]:
+        text += "…"
+    return text
@@ -0,0 +1 @@
+# Model engine for Plankton Model App